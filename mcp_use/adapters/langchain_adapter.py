@@ -4,36 +4,465 @@ LangChain adapter for MCP tools.
 This module provides utilities to convert MCP tools to LangChain tools.
 """
 
+import asyncio
+import hashlib
+import json
 import re
-from typing import Any, NoReturn
+import uuid
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, NoReturn, TypeVar
 
 from jsonschema_pydantic import jsonschema_to_pydantic
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, ToolException
 from mcp.types import (
     CallToolResult,
+    EmbeddedResource,
     Prompt,
     ReadResourceRequestParams,
     Resource,
 )
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
 
 from ..connectors.base import BaseConnector
 from ..errors.error_formatting import format_error
 from ..logging import logger
+from ..utils import get_shared_loop_thread
 from .base import BaseAdapter
 
+T = TypeVar("T")
+
+
+def _run_on_shared_loop(
+    tool_name: str,
+    loops: Iterable[asyncio.AbstractEventLoop | None],
+    make_coro: Callable[[], Coroutine[Any, Any, T]],
+) -> T:
+    """Run a tool coroutine on the shared loop thread for a synchronous caller.
+
+    Raises:
+        RuntimeError: If any of ``loops``, the loops owning the sessions or jobs the
+            coroutine awaits, is not the shared loop, where waiting would block forever.
+    """
+    loop_thread = get_shared_loop_thread()
+    if not all(loop_thread.owns(loop) for loop in loops):
+        raise RuntimeError(
+            f"Tool '{tool_name}' can only be called synchronously when its session was created "
+            "on the shared event loop (MCPClient.create_all_sessions_sync), use ainvoke instead"
+        )
+    return loop_thread.run(make_coro())
+
+
+def _fix_schema(schema: dict) -> dict:
+    """Convert list-valued 'type' entries to 'anyOf' and give bare enums a string type.
+
+    The schema is walked iteratively and rewritten in place; only dict and list nodes
+    are visited, scalar leaves are never touched.
+    """
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node_type = node.get("type")
+            if isinstance(node_type, list):
+                node["anyOf"] = [{"type": t} for t in node_type]
+                del node["type"]  # Remove 'type' and standardize to 'anyOf'
+
+            # Fix enum handling - ensure enum fields are properly typed as strings
+            if "enum" in node and "type" not in node:
+                node["type"] = "string"
+
+            stack.extend(value for value in node.values() if isinstance(value, dict | list))
+        elif isinstance(node, list):
+            stack.extend(value for value in node if isinstance(value, dict | list))
+    return schema
+
+
+@lru_cache(maxsize=512)
+def _compile_args_schema(schema_json: str) -> type[BaseModel]:
+    """Build the Pydantic model for a tool input schema, memoized by its JSON content.
+
+    Args:
+        schema_json: The tool input schema serialized with ``json.dumps(..., sort_keys=True)``.
+
+    Returns:
+        The Pydantic model validating the tool arguments.
+    """
+    return jsonschema_to_pydantic(_fix_schema(json.loads(schema_json)))
+
+
+@dataclass(slots=True)
+class ParsedToolResult:
+    """Text of an MCP tool result with its binary payloads kept apart.
+
+    Image, audio and blob payloads arrive base64-encoded and can be large. They are
+    kept as (mime_type, data) pairs and only appended to the text, one ``data:`` URI
+    per line, when the result is converted with ``str()``.
+    """
+
+    text: str
+    binaries: list[tuple[str, str]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return self.text + "".join(f"\ndata:{mime_type};base64,{data}" for mime_type, data in self.binaries)
+
+
+def _resource_content(item: EmbeddedResource) -> str | tuple[str, str]:
+    """Return the text of an embedded resource, or its mime type and base64 blob."""
+    resource = item.resource
+    text = getattr(resource, "text", None)
+    if text is not None:
+        return text
+    return resource.mimeType or "application/octet-stream", resource.blob
+
+
+# Maps each MCP content type to the function extracting its payload: a string for
+# textual content, a (mime_type, base64 data) pair for binary content
+_CONTENT_HANDLERS: dict[str, Callable[[Any], str | tuple[str, str]]] = {
+    "text": lambda item: item.text,
+    "image": lambda item: (item.mimeType, item.data),
+    "audio": lambda item: (item.mimeType, item.data),
+    "resource": _resource_content,
+    "resource_link": lambda item: str(item.uri),
+}
+
+
+def _parse_mcp_tool_result(tool_result: CallToolResult) -> str | ParsedToolResult:
+    """Flatten the content items of an MCP tool result.
+
+    Args:
+        tool_result: The result returned by the connector's call_tool.
+
+    Returns:
+        The concatenated text of every content item, or a ParsedToolResult holding
+        that text and the binary payloads when the result carries any.
+
+    Raises:
+        ToolException: If a content item has an unsupported type.
+    """
+    parts: list[str] = []
+    binaries: list[tuple[str, str]] = []
+    for item in tool_result.content:
+        try:
+            handler = _CONTENT_HANDLERS[item.type]
+        except KeyError:
+            raise ToolException(f"Unexpected content type: {item.type}") from None
+        payload = handler(item)
+        if isinstance(payload, str):
+            parts.append(payload)
+        else:
+            binaries.append(payload)
+    text = "".join(parts)
+    return ParsedToolResult(text, binaries) if binaries else text
+
+
+def _retrieve_task_exception(task: asyncio.Task) -> None:
+    """Mark the exception of a finished task as retrieved, so jobs that are never
+    polled do not log "Task exception was never retrieved"."""
+    if not task.cancelled():
+        task.exception()
+
+
+class ToolJobRegistry:
+    """Background MCP tool calls started by long-running tools, keyed by job id."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[CallToolResult]] = {}
+
+    def start(self, coro: Coroutine[Any, Any, CallToolResult]) -> str:
+        """Schedule a tool call on the running loop and return its job id."""
+        job_id = uuid.uuid4().hex
+        task = asyncio.create_task(coro)
+        task.add_done_callback(_retrieve_task_exception)
+        self._tasks[job_id] = task
+        return job_id
+
+    def get(self, job_id: str) -> asyncio.Task[CallToolResult] | None:
+        """Return the task of a job, or None if the id is unknown."""
+        return self._tasks.get(job_id)
+
+    def discard(self, job_id: str) -> None:
+        """Forget a finished job."""
+        self._tasks.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Forget all jobs without cancelling them."""
+        self._tasks.clear()
+
+    async def cancel_all(self) -> None:
+        """Cancel the jobs that are still running, wait for them to stop and forget all jobs."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        self.clear()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+class McpToLangChainAdapter(BaseTool):
+    """LangChain tool that forwards calls to an MCP tool through its connector."""
+
+    # Instances are immutable once built; use model_copy(update=...) to derive variants
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    description: str = ""
+    # Pydantic model for argument validation, converted from the tool's JSON schema
+    args_schema: type[BaseModel]
+    tool_connector: BaseConnector  # Renamed variable to avoid name conflict
+    # Set for long-running tools: calls run in the background and return a job id
+    jobs: ToolJobRegistry | None = None
+    handle_tool_error: bool = True
+
+    def __repr__(self) -> str:
+        return f"MCP tool: {self.name}: {self.description}"
+
+    def _run(self, **kwargs: Any) -> str | dict | ParsedToolResult:
+        """Synchronously execute the tool on the shared event loop thread.
+
+        Args:
+            kwargs: The arguments to pass to the tool.
+
+        Returns:
+            The result of the tool execution.
+
+        Raises:
+            RuntimeError: If the connector was not opened on the shared loop, where
+                awaiting its session from another loop would block forever.
+        """
+        return _run_on_shared_loop(self.name, [self.tool_connector.event_loop], lambda: self._arun(**kwargs))
+
+    async def _arun(self, **kwargs: Any) -> str | dict | ParsedToolResult:
+        """Asynchronously execute the tool with given arguments.
+
+        Args:
+            kwargs: The arguments to pass to the tool.
+
+        Returns:
+            The result of the tool execution.
+
+        Raises:
+            ToolException: If tool execution fails.
+        """
+        logger.debug('MCP tool: "%s" received input: %s', self.name, kwargs)
+        call_tool = self.tool_connector.call_tool
+
+        if self.jobs is not None:
+            job_id = self.jobs.start(call_tool(self.name, kwargs))
+            return {"job_id": job_id, "status": "started"}
+
+        try:
+            tool_result: CallToolResult = await call_tool(self.name, kwargs)
+            try:
+                return _parse_mcp_tool_result(tool_result)
+            except Exception as e:
+                # Log the exception for debugging
+                logger.error("Error parsing tool result: %s", e)
+                logger.debug("Raw content of %s result: %r", self.name, tool_result.content)
+                # Summarize the content, its repr may hold large base64 payloads
+                content_types = [getattr(item, "type", "?") for item in tool_result.content]
+                return format_error(
+                    e,
+                    tool=self.name,
+                    tool_content=f"{len(content_types)} items, types={content_types}",
+                )
+
+        except Exception as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name)  # Format the error to make LLM understand it
+            raise
+
+
+def _is_error(result: Any) -> bool:
+    """Whether a tool result is the structured error built by ``format_error``."""
+    return isinstance(result, dict) and isinstance(result.get("error"), str)
+
+
+class BatchCall(BaseModel):
+    """A single tool invocation inside a batch_execute request."""
+
+    tool: str = Field(description="Name of the tool to call")
+    args: dict[str, Any] = Field(default_factory=dict, description="Arguments to pass to the tool")
+
+
+class BatchExecuteInput(BaseModel):
+    """Input schema for the batch_execute tool."""
+
+    calls: list[BatchCall] = Field(description="Independent tool calls to run concurrently")
+
+
+class BatchExecuteTool(BaseTool):
+    """LangChain tool that runs several independent MCP tool calls concurrently."""
+
+    name: str = "batch_execute"
+    description: str = (
+        "Run several independent tool calls at once. Use this instead of calling tools one at a time "
+        "when none of the calls depends on the result of another. Returns a JSON list with one entry "
+        "per call, in the same order, holding either its 'result' or its 'error'. Each call's "
+        "arguments must match the input schema of its tool."
+    )
+    args_schema: type[BaseModel] = BatchExecuteInput
+    # MCP tools that can be called through the batch, keyed by tool name
+    mcp_tools: dict[str, McpToLangChainAdapter]
+    max_concurrent: int = 5
+    handle_tool_error: bool = True
+
+    def _run(self, calls: list[BatchCall]) -> list[dict]:
+        """Synchronously execute the calls on the shared event loop thread.
+
+        Raises:
+            RuntimeError: If a called tool's connector was not opened on the shared loop.
+        """
+        loops = [self.mcp_tools[call.tool].tool_connector.event_loop for call in calls if call.tool in self.mcp_tools]
+        return _run_on_shared_loop(self.name, loops, lambda: self._arun(calls))
+
+    async def _arun(self, calls: list[BatchCall]) -> list[dict]:
+        """Execute the calls concurrently and return one result entry per call, in order.
+
+        Each call is validated against its tool's argument schema and dispatched through
+        the tool itself, so long-running tools return a job and failures are reported as
+        the structured error built by ``format_error``.
+        """
+        logger.debug('Batch tool: "%s" received %d calls', self.name, len(calls))
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def _call(call: BatchCall) -> str | dict:
+            tool = self.mcp_tools.get(call.tool)
+            if tool is None:
+                return format_error(ToolException(f"Unknown tool: {call.tool}"), tool=call.tool)
+            try:
+                validated = tool.args_schema.model_validate(call.args)
+            except ValidationError as e:
+                return format_error(e, tool=call.tool)
+            async with semaphore:
+                result = await tool._arun(**validated.model_dump(exclude_unset=True))
+            return result if isinstance(result, dict) else str(result)
+
+        results = await asyncio.gather(*(_call(call) for call in calls), return_exceptions=True)
+
+        consolidated = []
+        for call, result in zip(calls, results, strict=True):
+            if isinstance(result, Exception):
+                result = format_error(result, tool=call.tool)
+            if _is_error(result):
+                consolidated.append({"tool": call.tool, "error": result})
+            else:
+                consolidated.append({"tool": call.tool, "result": result})
+        return consolidated
+
+
+class PollJobInput(BaseModel):
+    """Input schema for the poll_job tool."""
+
+    job_id: str = Field(description="Job id returned by a long-running tool")
+
+
+class PollJobTool(BaseTool):
+    """LangChain tool that reports the status or result of a long-running tool call."""
+
+    name: str = "poll_job"
+    description: str = (
+        "Check a job started by a long-running tool. Returns its status while it is running, "
+        "and its result once it has completed."
+    )
+    args_schema: type[BaseModel] = PollJobInput
+    jobs: ToolJobRegistry
+    handle_tool_error: bool = True
+
+    def _run(self, job_id: str) -> str | dict | ParsedToolResult:
+        """Synchronously check the job on the shared event loop thread.
+
+        Jobs started by synchronous tool calls run on the shared loop, so they can be
+        collected there.
+
+        Raises:
+            RuntimeError: If the job runs on another event loop.
+        """
+        task = self.jobs.get(job_id)
+        loops = [task.get_loop()] if task is not None else []
+        return _run_on_shared_loop(self.name, loops, lambda: self._arun(job_id))
+
+    async def _arun(self, job_id: str) -> str | dict | ParsedToolResult:
+        """Return the job status, or its parsed result once the job is done."""
+        task = self.jobs.get(job_id)
+        if task is None:
+            return format_error(ToolException(f"Unknown job id: {job_id}"), tool=self.name)
+        if not task.done():
+            return {"job_id": job_id, "status": "running"}
+
+        self.jobs.discard(job_id)
+        if task.cancelled():
+            return {"job_id": job_id, "status": "cancelled"}
+        try:
+            return _parse_mcp_tool_result(task.result())
+        except Exception as e:
+            if self.handle_tool_error:
+                return format_error(e, tool=self.name, job_id=job_id)
+            raise
+
 
 class LangChainAdapter(BaseAdapter):
     """Adapter for converting MCP tools to LangChain tools."""
 
-    def __init__(self, disallowed_tools: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        disallowed_tools: list[str] | None = None,
+        batch_tool_calls: bool = False,
+        max_concurrent_calls: int = 5,
+        long_running_tools: list[str] | None = None,
+    ) -> None:
         """Initialize a new LangChain adapter.
 
         Args:
             disallowed_tools: list of tool names that should not be available.
+            batch_tool_calls: Whether to add a batch_execute tool that runs independent
+                MCP tool calls concurrently.
+            max_concurrent_calls: Maximum number of calls batch_execute runs at the same time.
+            long_running_tools: list of tool names that run in the background. Calling them
+                returns a job id, and a poll_job tool is added to fetch their results.
         """
         super().__init__(disallowed_tools)
+        self.batch_tool_calls = batch_tool_calls
+        self.max_concurrent_calls = max_concurrent_calls
+        self.long_running_tools = long_running_tools or []
+        self._jobs = ToolJobRegistry()
         self._connector_tool_map: dict[BaseConnector, list[BaseTool]] = {}
+        # Converted tools by name with the digest of the definition they were built from,
+        # so reconnecting connectors reuse them while the tool definition is unchanged
+        self._tool_cache: dict[str, tuple[str, McpToLangChainAdapter]] = {}
+
+    async def _create_tools_from_connectors(self, connectors: list[BaseConnector]) -> list[BaseTool]:
+        """Create tools from all connectors, adding the batch_execute and poll_job tools if enabled.
+
+        Args:
+            connectors: list of MCP connectors to create tools from.
+
+        Returns:
+            A list of LangChain tools.
+        """
+        tools = await super()._create_tools_from_connectors(connectors)
+        mcp_tools: dict[str, McpToLangChainAdapter] = {}
+        for tool in tools:
+            if not isinstance(tool, McpToLangChainAdapter):
+                continue
+            if tool.name in mcp_tools:
+                # The agent resolves tool names to the last tool that uses them, do the same
+                logger.warning(
+                    f"Tool '{tool.name}' is provided by several servers, calls will go to "
+                    f"{tool.tool_connector.public_identifier}"
+                )
+            mcp_tools[tool.name] = tool
+
+        if self.batch_tool_calls and mcp_tools and "batch_execute" not in self.disallowed_tools:
+            tools = [*tools, BatchExecuteTool(mcp_tools=mcp_tools, max_concurrent=self.max_concurrent_calls)]
+        if any(tool.jobs is not None for tool in mcp_tools.values()):
+            tools = [*tools, PollJobTool(jobs=self._jobs)]
+        return tools
+
+    async def cancel_jobs(self) -> None:
+        """Cancel the background calls of long-running tools that are still running."""
+        await self._jobs.cancel_all()
 
     def fix_schema(self, schema: dict) -> dict:
         """Convert JSON Schema 'type': ['string', 'null'] to 'anyOf' format and fix enum handling.
@@ -44,18 +473,18 @@ class LangChainAdapter(BaseAdapter):
         Returns:
             The fixed JSON schema.
         """
-        if isinstance(schema, dict):
-            if "type" in schema and isinstance(schema["type"], list):
-                schema["anyOf"] = [{"type": t} for t in schema["type"]]
-                del schema["type"]  # Remove 'type' and standardize to 'anyOf'
+        return _fix_schema(schema)
 
-            # Fix enum handling - ensure enum fields are properly typed as strings
-            if "enum" in schema and "type" not in schema:
-                schema["type"] = "string"
+    def _parse_mcp_tool_result(self, tool_result: CallToolResult) -> str | ParsedToolResult:
+        """Parse the content of a CallToolResult.
+
+        Args:
+            tool_result: The result object from calling an MCP tool.
 
-            for key, value in schema.items():
-                schema[key] = self.fix_schema(value)  # Apply recursively
-        return schema
+        Returns:
+            The text of the tool result, or a ParsedToolResult if it carries binary content.
+        """
+        return _parse_mcp_tool_result(tool_result)
 
     def _convert_tool(self, mcp_tool: dict[str, Any], connector: BaseConnector) -> BaseTool:
         """Convert an MCP tool to LangChain's tool format.
@@ -71,60 +500,35 @@ class LangChainAdapter(BaseAdapter):
         if mcp_tool.name in self.disallowed_tools:
             return None
 
-        # This is a dynamic class creation, we need to work with the self reference
-        adapter_self = self
-
-        class McpToLangChainAdapter(BaseTool):
-            name: str = mcp_tool.name or "NO NAME"
-            description: str = mcp_tool.description or ""
-            # Convert JSON schema to Pydantic model for argument validation
-            args_schema: type[BaseModel] = jsonschema_to_pydantic(
-                adapter_self.fix_schema(mcp_tool.inputSchema)  # Apply schema conversion
+        name = mcp_tool.name or "NO NAME"
+        description = mcp_tool.description or ""
+        schema_json = json.dumps(mcp_tool.inputSchema, sort_keys=True)
+        digest = hashlib.blake2b(f"{description}\0{schema_json}".encode(), digest_size=8).hexdigest()
+
+        cached = self._tool_cache.get(name)
+        if cached is not None and cached[0] == digest:
+            tool = cached[1]
+            if tool.tool_connector is connector:
+                return tool
+            # Same definition served by a new connector (e.g. after a reconnect)
+            tool = tool.model_copy(update={"tool_connector": connector})
+        else:
+            long_running = name in self.long_running_tools
+            if long_running:
+                description += (
+                    "\n\nThis tool runs in the background: it returns a job_id, pass it to poll_job to get the result."
+                )
+            tool = McpToLangChainAdapter(
+                name=name,
+                description=description,
+                # Identical input schemas share a single compiled Pydantic model
+                args_schema=_compile_args_schema(schema_json),
+                tool_connector=connector,
+                jobs=self._jobs if long_running else None,
             )
-            tool_connector: BaseConnector = connector  # Renamed variable to avoid name conflict
-            handle_tool_error: bool = True
-
-            def __repr__(self) -> str:
-                return f"MCP tool: {self.name}: {self.description}"
-
-            def _run(self, **kwargs: Any) -> NoReturn:
-                """Synchronous run method that always raises an error.
-
-                Raises:
-                    NotImplementedError: Always raises this error because MCP tools
-                        only support async operations.
-                """
-                raise NotImplementedError("MCP tools only support async operations")
-
-            async def _arun(self, **kwargs: Any) -> str | dict:
-                """Asynchronously execute the tool with given arguments.
-
-                Args:
-                    kwargs: The arguments to pass to the tool.
-
-                Returns:
-                    The result of the tool execution.
-
-                Raises:
-                    ToolException: If tool execution fails.
-                """
-                logger.debug(f'MCP tool: "{self.name}" received input: {kwargs}')
-
-                try:
-                    tool_result: CallToolResult = await self.tool_connector.call_tool(self.name, kwargs)
-                    try:
-                        return str(tool_result.content)
-                    except Exception as e:
-                        # Log the exception for debugging
-                        logger.error(f"Error parsing tool result: {e}")
-                        return format_error(e, tool=self.name, tool_content=tool_result.content)
-
-                except Exception as e:
-                    if self.handle_tool_error:
-                        return format_error(e, tool=self.name)  # Format the error to make LLM understand it
-                    raise
 
-        return McpToLangChainAdapter()
+        self._tool_cache[name] = (digest, tool)
+        return tool
 
     def _convert_resource(self, mcp_resource: Resource, connector: BaseConnector) -> BaseTool:
         """Convert an MCP resource to LangChain's tool format.
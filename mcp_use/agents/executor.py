@@ -0,0 +1,148 @@
+"""
+Agent executor used by MCPAgent.
+
+This module provides an AgentExecutor subclass that runs the tool calls of a
+single agent step concurrently, keeps their failures isolated and stops runs
+that keep repeating the same failing tool call.
+"""
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import AsyncCallbackManagerForChainRun
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+from ..logging import logger
+
+
+class _FailedAction:
+    """Placeholder observation for an action whose tool call raised."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _failure_class(observation: Any) -> str | None:
+    """Return the error class of a failed tool observation, or None if the call succeeded.
+
+    Tools created by the adapters report handled errors as the dictionary built by
+    ``format_error``, whose ``error`` entry holds the exception class name.
+    """
+    if isinstance(observation, dict) and isinstance(observation.get("error"), str):
+        return observation["error"]
+    return None
+
+
+def _tool_calls(action: AgentAction, observation: Any) -> Iterator[tuple[str, Any, Any]]:
+    """Yield the tool name, arguments and observation of each tool call made by an action.
+
+    The ``batch_execute`` tool reports one ``{"tool", "result" | "error"}`` entry per call
+    it ran, so every call of a batch is counted on its own.
+    """
+    calls = action.tool_input.get("calls") if isinstance(action.tool_input, dict) else None
+    if isinstance(observation, list) and isinstance(calls, list) and len(calls) == len(observation):
+        for call, entry in zip(calls, observation, strict=True):
+            if isinstance(call, dict) and isinstance(entry, dict):
+                yield entry.get("tool", call.get("tool")), call.get("args", {}), entry.get("error")
+        return
+    yield action.tool, action.tool_input, observation
+
+
+class MCPAgentExecutor(AgentExecutor):
+    """AgentExecutor that settles every tool call of a step before surfacing errors.
+
+    When the LLM emits several tool calls in one turn they are dispatched concurrently
+    with ``asyncio.gather``. The stock executor aborts the gather on the first failing
+    call while the sibling calls keep running unobserved; here every call runs to
+    completion, observations keep the planner's order, and the first error is re-raised
+    only once the whole batch has finished.
+
+    When the same tool is called with the same arguments and fails with the same error
+    ``max_repeated_failures`` times within a run, the run is finished early instead of
+    feeding the growing error history back to the LLM.
+    """
+
+    max_repeated_failures: int = 3
+    _failure_counts: dict[tuple[str, str, str], int] = PrivateAttr(default_factory=dict)
+
+    async def _aperform_agent_action(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        agent_action: AgentAction,
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentStep:
+        try:
+            return await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+        except Exception as e:
+            return AgentStep(action=agent_action, observation=_FailedAction(e))
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        inputs: dict[str, str],
+        intermediate_steps: list[tuple[AgentAction, str]],
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AsyncIterator[AgentFinish | AgentAction | AgentStep]:
+        # The tool calls of a step settle together, so holding their results back until
+        # the batch is checked for failures delays nothing
+        steps: list[AgentStep] = []
+        async for chunk in super()._aiter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            if isinstance(chunk, AgentStep):
+                steps.append(chunk)
+            else:
+                yield chunk
+
+        for step in steps:
+            if isinstance(step.observation, _FailedAction):
+                raise step.observation.error
+        for step in steps:
+            yield step
+
+    async def _atake_next_step(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        inputs: dict[str, str],
+        intermediate_steps: list[tuple[AgentAction, str]],
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentFinish | list[tuple[AgentAction, str]]:
+        if not intermediate_steps:
+            # A new run starts, forget the failures of previous runs
+            self._failure_counts.clear()
+
+        output = await super()._atake_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        )
+        if isinstance(output, AgentFinish):
+            return output
+        return self._check_repeated_failures(output)
+
+    def _check_repeated_failures(
+        self, output: list[tuple[AgentAction, Any]]
+    ) -> AgentFinish | list[tuple[AgentAction, Any]]:
+        """Count failed calls and finish the run once one repeats too often."""
+        for action, observation in output:
+            for tool, tool_input, tool_observation in _tool_calls(action, observation):
+                error_class = _failure_class(tool_observation)
+                if error_class is None:
+                    continue
+
+                args_key = json.dumps(tool_input, sort_keys=True, default=str)
+                key = (tool, args_key, error_class)
+                count = self._failure_counts.get(key, 0) + 1
+                self._failure_counts[key] = count
+                if count >= self.max_repeated_failures:
+                    logger.warning(f"⚠️ Tool '{tool}' failed {count} times with {error_class}, stopping the run")
+                    message = f"Aborted due to repeated tool failure: {tool} failed {count} times with {error_class}."
+                    return AgentFinish(return_values={"output": message}, log=message)
+        return output
@@ -18,6 +18,7 @@ from langchain.schema import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain.schema.language_model import BaseLanguageModel
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
 from langchain_core.runnables.schema import StreamEvent
 from langchain_core.tools import BaseTool
 from langchain_core.utils.input import get_color_mapping
@@ -28,13 +29,14 @@ from mcp_use.connectors.base import BaseConnector
 from mcp_use.telemetry.telemetry import Telemetry
 from mcp_use.telemetry.utils import extract_model_info
 
-from ..adapters.langchain_adapter import LangChainAdapter
+from ..adapters.langchain_adapter import LangChainAdapter, ParsedToolResult
 from ..logging import logger
 from ..managers.base import BaseServerManager
 from ..managers.server_manager import ServerManager
 
 # Import observability manager
 from ..observability import ObservabilityManager
+from .executor import MCPAgentExecutor
 from .prompts.system_prompt_builder import create_system_message
 from .prompts.templates import DEFAULT_SYSTEM_PROMPT_TEMPLATE, SERVER_MANAGER_SYSTEM_PROMPT_TEMPLATE
 from .remote import RemoteAgent
@@ -75,6 +77,8 @@ class MCPAgent:
         chat_id: str | None = None,
         retry_on_error: bool = True,
         max_retries_per_step: int = 2,
+        batch_tool_calls: bool = False,
+        long_running_tools: list[str] | None = None,
     ):
         """Initialize a new MCPAgent instance.
 
@@ -96,6 +100,10 @@ class MCPAgent:
             callbacks: List of LangChain callbacks to use. If None and Langfuse is configured, uses langfuse_handler.
             retry_on_error: Whether to retry tool calls that fail due to validation errors.
             max_retries_per_step: Maximum number of retries for validation errors per step.
+            batch_tool_calls: Whether to expose a batch_execute tool that lets the LLM run
+                independent tool calls concurrently in a single step.
+            long_running_tools: Names of tools that run in the background. Calling them returns
+                a job id right away and a poll_job tool is exposed to fetch their results.
         """
         # Handle remote execution
         if agent_id is not None:
@@ -140,7 +148,11 @@ class MCPAgent:
             raise ValueError("Either client or connector must be provided")
 
         # Create the adapter for tool conversion
-        self.adapter = LangChainAdapter(disallowed_tools=self.disallowed_tools)
+        self.adapter = LangChainAdapter(
+            disallowed_tools=self.disallowed_tools,
+            batch_tool_calls=batch_tool_calls,
+            long_running_tools=long_running_tools,
+        )
 
         # Initialize telemetry
         self.telemetry = Telemetry()
@@ -154,6 +166,9 @@ class MCPAgent:
         self._agent_executor: AgentExecutor | None = None
         self._system_message: SystemMessage | None = None
         self._tools: list[BaseTool] = []
+        # Last agent runnable built, keyed by LLM, system prompt, memory mode and tool schemas
+        self._agent_cache_key: tuple | None = None
+        self._agent_cache: tuple[BaseLanguageModel, list[BaseTool], Runnable] | None = None
 
         # Track model info for telemetry
         self._model_provider, self._model_name = extract_model_info(self.llm)
@@ -287,34 +302,48 @@ class MCPAgent:
         if self._system_message:
             system_content = self._system_message.content
 
-        if self.memory_enabled:
-            # Query already in chat_history — don't re-inject it
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", system_content),
-                    MessagesPlaceholder(variable_name="chat_history"),
-                    ("human", "{input}"),
-                    MessagesPlaceholder(variable_name="agent_scratchpad"),
-                ]
-            )
+        # The agent runnable is pure given the LLM, prompt and tool schemas, so reuse it
+        # when the agent is recreated with the same configuration
+        cache_key = (
+            id(self.llm),
+            system_content,
+            self.memory_enabled,
+            tuple((tool.name, tool.description, id(tool.args_schema)) for tool in self._tools),
+        )
+        if self._agent_cache is not None and cache_key == self._agent_cache_key:
+            agent = self._agent_cache[-1]
         else:
-            # No memory — inject input directly
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", system_content),
-                    ("human", "{input}"),
-                    MessagesPlaceholder(variable_name="agent_scratchpad"),
-                ]
-            )
+            if self.memory_enabled:
+                # Query already in chat_history — don't re-inject it
+                prompt = ChatPromptTemplate.from_messages(
+                    [
+                        ("system", system_content),
+                        MessagesPlaceholder(variable_name="chat_history"),
+                        ("human", "{input}"),
+                        MessagesPlaceholder(variable_name="agent_scratchpad"),
+                    ]
+                )
+            else:
+                # No memory — inject input directly
+                prompt = ChatPromptTemplate.from_messages(
+                    [
+                        ("system", system_content),
+                        ("human", "{input}"),
+                        MessagesPlaceholder(variable_name="agent_scratchpad"),
+                    ]
+                )
 
-        tool_names = [tool.name for tool in self._tools]
-        logger.info(f"🧠 Agent ready with tools: {', '.join(tool_names)}")
+            # Use the standard create_tool_calling_agent
+            agent = create_tool_calling_agent(llm=self.llm, tools=self._tools, prompt=prompt)
+            # Keep the LLM and tools alive alongside the agent so the ids in the key stay unique
+            self._agent_cache_key = cache_key
+            self._agent_cache = (self.llm, list(self._tools), agent)
 
-        # Use the standard create_tool_calling_agent
-        agent = create_tool_calling_agent(llm=self.llm, tools=self._tools, prompt=prompt)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🧠 Agent ready with tools: {', '.join(tool.name for tool in self._tools)}")
 
-        # Use the standard AgentExecutor with callbacks
-        executor = AgentExecutor(
+        # Tool calls of a single step are dispatched concurrently by the executor
+        executor = MCPAgentExecutor(
             agent=agent,
             tools=self._tools,
             max_iterations=self.max_steps,
@@ -685,8 +714,11 @@ class MCPAgent:
                         if len(tool_input_str) > 100:
                             tool_input_str = tool_input_str[:97] + "..."
                         logger.info(f"🔧 Tool call: {tool_name} with input: {tool_input_str}")
-                        # Truncate long outputs for readability
-                        observation_str = str(observation)
+                        # Truncate long outputs for readability, leaving out binary payloads
+                        if isinstance(observation, ParsedToolResult):
+                            observation_str = f"{observation.text} [+{len(observation.binaries)} binary item(s)]"
+                        else:
+                            observation_str = str(observation)
                         if len(observation_str) > 100:
                             observation_str = observation_str[:97] + "..."
                         observation_str = observation_str.replace("\n", " ")
@@ -1116,6 +1148,9 @@ class MCPAgent:
             self._agent_executor = None
             self._tools = []
 
+            # Stop background tool calls before their sessions go away
+            await self.adapter.cancel_jobs()
+
             # If using client with session, close the session through client
             if self.client:
                 logger.info("🔄 Closing sessions through client")
@@ -1,6 +1,8 @@
 from langchain.schema import SystemMessage
 from langchain_core.tools import BaseTool
 
+from ...logging import logger
+
 
 def generate_tool_descriptions(tools: list[BaseTool], disallowed_tools: list[str] | None = None) -> list[str]:
     """
@@ -45,7 +47,7 @@ def build_system_prompt_content(
     if "{tool_descriptions}" not in template:
         # Handle this case: maybe append descriptions at the end or raise an error
         # For now, let's append if placeholder is missing
-        print("Warning: '{tool_descriptions}' placeholder not found in template.")
+        logger.warning("'{tool_descriptions}' placeholder not found in template.")
         system_prompt_content = template + "\n\nAvailable tools:\n" + tool_descriptions_block
     else:
         system_prompt_content = template.format(tool_descriptions=tool_descriptions_block)
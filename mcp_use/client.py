@@ -17,6 +17,7 @@ from .config import create_connector_from_config, load_config_file
 from .logging import logger
 from .middleware import Middleware, default_logging_middleware
 from .session import MCPSession
+from .utils import get_shared_loop_thread
 
 
 class MCPClient:
@@ -325,6 +326,24 @@ class MCPClient:
             if server_name in self.active_sessions:
                 self.active_sessions.remove(server_name)
 
+    def create_all_sessions_sync(self, auto_initialize: bool = True) -> dict[str, MCPSession]:
+        """Create sessions for all configured servers on the shared event loop thread.
+
+        Sessions created this way can be used by synchronous tool calls, such as
+        ``tool.invoke()`` on the tools built by the LangChain adapter.
+
+        Args:
+            auto_initialize: Whether to automatically initialize the sessions.
+
+        Returns:
+            Dictionary mapping server names to their MCPSession instances.
+        """
+        return get_shared_loop_thread().run(self.create_all_sessions(auto_initialize))
+
+    def close_all_sessions_sync(self) -> None:
+        """Close all active sessions created with ``create_all_sessions_sync``."""
+        get_shared_loop_thread().run(self.close_all_sessions())
+
     async def close_all_sessions(self) -> None:
         """Close all active sessions.
 
@@ -5,6 +5,7 @@ This module provides the base connector interface that all MCP connectors
 must implement.
 """
 
+import asyncio
 import warnings
 from abc import ABC, abstractmethod
 from datetime import timedelta
@@ -104,6 +105,16 @@ class BaseConnector(ABC):
         """Get the identifier for the connector."""
         pass
 
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop the connection was opened on, or None if not connected.
+
+        The session streams belong to this loop, so calls must be awaited on it.
+        """
+        if not self._connection_manager:
+            return None
+        return self._connection_manager.loop
+
     async def disconnect(self) -> None:
         """Close the connection to the MCP implementation."""
         if not self._connected:
@@ -368,10 +379,10 @@ class BaseConnector(ABC):
         # Ensure we're connected
         await self._ensure_connected()
 
-        logger.debug(f"Calling tool '{name}' with arguments: {arguments}")
+        logger.debug("Calling tool '%s' with arguments: %s", name, arguments)
         try:
             result = await self.client_session.call_tool(name, arguments, read_timeout_seconds)
-            logger.debug(f"Tool '{name}' called with result: {result}")
+            logger.debug("Tool '%s' called with result: %s", name, result)
             return result
         except Exception as e:
             # Check if the error might be due to connection loss
@@ -40,7 +40,7 @@ T = TypeVar("T")
 R = TypeVar("R", covariant=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class MiddlewareContext(Generic[T]):
     """Unified, typed context for all middleware operations."""
 
@@ -52,7 +52,7 @@ class MiddlewareContext(Generic[T]):
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPResponseContext:
     """Extended context for MCP responses with middleware metadata."""
 
@@ -230,7 +230,9 @@ class CallbackClientSession:
         return await self._intercept_call("tools/list", None, lambda: self._client_session.list_tools(*args, **kwargs))
 
     async def call_tool(self, name: str, arguments: dict[str, Any], *args, **kwargs) -> CallToolResult:
-        params = CallToolRequestParams(name=name, arguments=arguments)
+        # The params only describe the call to middleware, the session builds the actual request
+        # and the server validates the arguments, so skip Pydantic validation here
+        params = CallToolRequestParams.model_construct(name=name, arguments=arguments)
         return await self._intercept_call(
             "tools/call", params, lambda: self._client_session.call_tool(name, arguments, *args, **kwargs)
         )
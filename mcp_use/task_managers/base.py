@@ -99,6 +99,11 @@ class ConnectionManager(Generic[T], ABC):
         await self._done_event.wait()
         logger.debug(f"{self.__class__.__name__} task completed")
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop running the connection task, or None if it was never started."""
+        return self._task.get_loop() if self._task else None
+
     def get_streams(self) -> T | None:
         """Get the current connection streams.
 
@@ -1,3 +1,12 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
 def singleton(cls):
     """A decorator that implements the singleton pattern for a class.
 
@@ -25,3 +34,61 @@ def singleton(cls):
         return instance[0]
 
     return wrapper
+
+
+class AsyncLoopThread:
+    """An asyncio event loop running forever in a daemon thread.
+
+    Synchronous code can hand coroutines to the loop with ``submit`` or ``run``, so
+    many threads share one loop instead of each spinning up its own. The thread is
+    started lazily on first use. MCP sessions are bound to the loop they were opened
+    on, so connectors used through this loop should also be connected through it.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, starting its thread if it is not running yet."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="mcp-use-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def owns(self, loop: asyncio.AbstractEventLoop | None) -> bool:
+        """Whether ``loop`` is this thread's event loop, without starting the thread."""
+        return loop is not None and loop is self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the loop and return a future for its result.
+
+        Raises:
+            RuntimeError: If called from the loop thread itself, where waiting on the
+                future would deadlock.
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the shared event loop from its own thread")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and block until it completes."""
+        return self.submit(coro).result()
+
+
+_SHARED_LOOP_THREAD = AsyncLoopThread()
+
+
+def get_shared_loop_thread() -> AsyncLoopThread:
+    """Return the loop thread shared by the synchronous entry points of mcp_use.
+
+    Synchronous tool calls run on this loop, so the sessions they use must be opened
+    on it too, e.g. with ``MCPClient.create_all_sessions_sync``.
+    """
+    return _SHARED_LOOP_THREAD
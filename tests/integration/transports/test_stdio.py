@@ -3,6 +3,8 @@ from pathlib import Path
 import pytest
 
 from mcp_use import MCPClient
+from mcp_use.adapters.langchain_adapter import LangChainAdapter
+from mcp_use.utils import get_shared_loop_thread
 
 
 @pytest.fixture
@@ -51,3 +53,43 @@ async def test_stdio_connection(server_process):
         assert result.content[0].text == "8", "Result should be 8"
     finally:
         await client.close_all_sessions()
+
+
+def _stdio_config(server_path: Path) -> dict:
+    return {
+        "mcpServers": {
+            "stdio": {
+                "command": "python",
+                "args": [str(server_path)],
+                "cwd": str(server_path.parent),
+            }
+        }
+    }
+
+
+def test_sync_tool_call_on_shared_loop_sessions(server_process):
+    """Tools of sessions created on the shared loop can be invoked synchronously"""
+    client = MCPClient(config=_stdio_config(server_process))
+    try:
+        client.create_all_sessions_sync()
+        tools = get_shared_loop_thread().run(LangChainAdapter().create_tools(client))
+        add = next(tool for tool in tools if tool.name == "add")
+
+        assert add.invoke({"a": 5, "b": 3}) == "8"
+    finally:
+        client.close_all_sessions_sync()
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_call_rejects_sessions_of_other_loops(server_process):
+    """Invoking a tool synchronously fails fast when its session lives on another loop"""
+    client = MCPClient(config=_stdio_config(server_process))
+    try:
+        tools = await LangChainAdapter().create_tools(client)
+        add = next(tool for tool in tools if tool.name == "add")
+
+        with pytest.raises(RuntimeError, match="create_all_sessions_sync"):
+            add.invoke({"a": 5, "b": 3})
+        assert await add.ainvoke({"a": 5, "b": 3}) == "8"
+    finally:
+        await client.close_all_sessions()
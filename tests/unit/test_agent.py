@@ -2,11 +2,14 @@
 Unit tests for the MCPAgent class.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain.schema import HumanMessage
 from langchain_core.agents import AgentFinish
+from langchain_core.runnables import RunnableLambda
+from mcp.types import Tool
 
 from mcp_use.agents.mcpagent import MCPAgent
 from mcp_use.client import MCPClient
@@ -77,6 +80,80 @@ class TestMCPAgentInitialization:
         assert agent._remote_agent is not None
 
 
+class TestMCPAgentCreateAgent:
+    """Tests for MCPAgent._create_agent"""
+
+    def _mock_llm(self):
+        llm = MagicMock()
+        llm._llm_type = "test-provider"
+        llm._identifying_params = {"model": "test-model"}
+        return llm
+
+    def test_agent_runnable_is_reused_for_same_configuration(self):
+        """Recreating the agent with an unchanged configuration skips rebuilding the runnable."""
+        agent = MCPAgent(llm=self._mock_llm(), client=MagicMock(spec=MCPClient))
+        agent.set_system_message("first")
+
+        with patch(
+            "mcp_use.agents.mcpagent.create_tool_calling_agent",
+            side_effect=lambda **kwargs: RunnableLambda(lambda _: None),
+        ) as mock_create:
+            first = agent._create_agent()
+            second = agent._create_agent()
+            agent.set_system_message("second")
+            third = agent._create_agent()
+            agent.set_system_message("first")
+            fourth = agent._create_agent()
+
+        assert mock_create.call_count == 3
+        assert first.agent.runnable is second.agent.runnable
+        assert third.agent.runnable is not first.agent.runnable
+        # Only the last runnable is kept, switching back rebuilds it
+        assert fourth.agent.runnable is not first.agent.runnable
+
+
+class TestMCPAgentClose:
+    """Tests for MCPAgent.close"""
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_background_jobs(self):
+        """Closing the agent cancels the jobs of long-running tools."""
+        cancelled = asyncio.Event()
+
+        async def _call_tool(name, args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        connector = MagicMock(spec=BaseConnector)
+        connector.tools = [Tool(name="render", description="Render", inputSchema={"type": "object"})]
+        connector.list_tools = AsyncMock(return_value=connector.tools)
+        connector.list_resources = AsyncMock(return_value=[])
+        connector.list_prompts = AsyncMock(return_value=[])
+        connector.call_tool = AsyncMock(side_effect=_call_tool)
+        llm = MagicMock()
+        llm._llm_type = "test-provider"
+        llm._identifying_params = {"model": "test-model"}
+        client = MagicMock(spec=MCPClient)
+        client.active_sessions = ["render"]
+        client.get_all_active_sessions.return_value = {"render": MagicMock(connector=connector)}
+        client.close_all_sessions = AsyncMock()
+        agent = MCPAgent(llm=llm, client=client, long_running_tools=["render"])
+        tools = {tool.name: tool for tool in await agent.adapter.create_tools(client)}
+        started = await tools["render"].ainvoke({})
+        await asyncio.sleep(0)
+
+        await agent.close()
+
+        assert cancelled.is_set()
+        assert (await tools["poll_job"].ainvoke({"job_id": started["job_id"]}))["details"] == (
+            f"Unknown job id: {started['job_id']}"
+        )
+        client.close_all_sessions.assert_awaited_once()
+
+
 class TestMCPAgentRun:
     """Tests for MCPAgent.run"""
 
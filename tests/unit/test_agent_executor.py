@@ -0,0 +1,161 @@
+"""
+Unit tests for the MCPAgentExecutor class.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from langchain.agents import BaseMultiActionAgent
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.tools import BaseTool
+
+from mcp_use.agents.executor import MCPAgentExecutor
+
+
+class _PlannedAgent(BaseMultiActionAgent):
+    """Agent that emits a fixed batch of actions."""
+
+    actions: list[AgentAction]
+
+    @property
+    def input_keys(self) -> list[str]:
+        return ["input"]
+
+    def plan(self, intermediate_steps, callbacks=None, **kwargs: Any) -> list[AgentAction] | AgentFinish:
+        return self.actions
+
+    async def aplan(self, intermediate_steps, callbacks=None, **kwargs: Any) -> list[AgentAction] | AgentFinish:
+        return self.actions
+
+
+class _SleepTool(BaseTool):
+    description: str = "Sleep and echo"
+    delay: float = 0.1
+    fail: bool = False
+    finished: list[str] = []
+
+    def _run(self, **kwargs: Any) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, value: str) -> str:
+        await asyncio.sleep(self.delay)
+        self.finished.append(self.name)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return f"{self.name}:{value}"
+
+
+def _executor(tools: list[BaseTool]) -> MCPAgentExecutor:
+    actions = [AgentAction(tool=tool.name, tool_input={"value": "x"}, log="") for tool in tools]
+    return MCPAgentExecutor(agent=_PlannedAgent(actions=actions), tools=tools)
+
+
+async def _step(executor: MCPAgentExecutor, intermediate_steps=None):
+    return await executor._atake_next_step(
+        name_to_tool_map={tool.name: tool for tool in executor.tools},
+        color_mapping={tool.name: "blue" for tool in executor.tools},
+        inputs={"input": "q"},
+        intermediate_steps=list(intermediate_steps or []),
+    )
+
+
+class TestMCPAgentExecutor:
+    """Tests for settling the concurrent tool calls of a step in MCPAgentExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised_after_siblings_finish(self):
+        """A failing tool call does not abandon the other calls of the batch."""
+        tools = [_SleepTool(name="broken", delay=0.01, fail=True), _SleepTool(name="slow", delay=0.1)]
+        executor = _executor(tools)
+
+        with pytest.raises(RuntimeError, match="broken failed"):
+            await _step(executor)
+
+        assert [tool.finished for tool in tools] == [["broken"], ["slow"]]
+
+    @pytest.mark.asyncio
+    async def test_streamed_step_raises_instead_of_leaking_placeholder(self):
+        """Streaming runs surface the tool error rather than passing a placeholder observation on."""
+        tools = [_SleepTool(name="broken", delay=0.01, fail=True), _SleepTool(name="slow", delay=0.05)]
+        executor = _executor(tools)
+        chunks = []
+
+        with pytest.raises(RuntimeError, match="broken failed"):
+            async for chunk in executor.astream({"input": "q"}):
+                chunks.append(chunk)
+
+        assert all("steps" not in chunk for chunk in chunks)
+        assert [tool.finished for tool in tools] == [["broken"], ["slow"]]
+
+
+class _FailingTool(BaseTool):
+    description: str = "Always fails"
+
+    def _run(self, **kwargs: Any) -> str:
+        raise NotImplementedError
+
+    async def _arun(self, value: str) -> dict:
+        return {"error": "TimeoutError", "details": "timed out", "tool": self.name}
+
+
+class _BatchTool(BaseTool):
+    name: str = "batch_execute"
+    description: str = "Runs calls, the 'flaky' one always fails"
+
+    def _run(self, **kwargs: Any) -> list:
+        raise NotImplementedError
+
+    async def _arun(self, calls: list[dict]) -> list[dict]:
+        return [
+            {"tool": call["tool"], "error": {"error": "TimeoutError", "details": "timed out"}}
+            if call["tool"] == "flaky"
+            else {"tool": call["tool"], "result": "ok"}
+            for call in calls
+        ]
+
+
+class TestMCPAgentExecutorFailureGuard:
+    """Tests for stopping runs that repeat the same failing tool call"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_identical_failure_finishes_run(self):
+        """The third identical failure ends the run with an explanatory output."""
+        executor = _executor([_FailingTool(name="flaky")])
+        steps = []
+
+        for _ in range(2):
+            output = await _step(executor, intermediate_steps=steps)
+            assert isinstance(output, list)
+            steps.extend(output)
+
+        output = await _step(executor, intermediate_steps=steps)
+
+        assert isinstance(output, AgentFinish)
+        assert "flaky failed 3 times with TimeoutError" in output.return_values["output"]
+
+    @pytest.mark.asyncio
+    async def test_failure_counts_reset_between_runs(self):
+        """A new run (no intermediate steps) starts counting from zero."""
+        executor = _executor([_FailingTool(name="flaky")])
+
+        for _ in range(5):
+            output = await _step(executor)
+            assert isinstance(output, list)
+
+    @pytest.mark.asyncio
+    async def test_failures_inside_batches_are_counted_per_call(self):
+        """A call that keeps failing inside different batches still ends the run."""
+        executor = _executor([_BatchTool()])
+        steps = []
+
+        for other in ("a", "b", "c"):
+            calls = [{"tool": other, "args": {}}, {"tool": "flaky", "args": {"q": 1}}]
+            executor.agent.actions = [AgentAction(tool="batch_execute", tool_input={"calls": calls}, log="")]
+            output = await _step(executor, intermediate_steps=steps)
+            if isinstance(output, AgentFinish):
+                break
+            steps.extend(output)
+
+        assert isinstance(output, AgentFinish)
+        assert "flaky failed 3 times with TimeoutError" in output.return_values["output"]
@@ -104,6 +104,21 @@ class TestEnumHandling(unittest.TestCase):
         self.assertIn("type", nested_props["code_type"])
         self.assertEqual(nested_props["code_type"]["type"], "string")
 
+    def test_schema_fixing_descends_into_lists(self):
+        """Test that schemas nested in lists are fixed and scalar lists are left alone."""
+        schema = {
+            "type": "object",
+            "properties": {"choice": {"anyOf": [{"enum": ["a", "b"]}, {"type": ["integer", "null"]}]}},
+            "required": ["choice"],
+        }
+
+        fixed_schema = self.adapter.fix_schema(schema)
+
+        variants = fixed_schema["properties"]["choice"]["anyOf"]
+        self.assertEqual(variants[0], {"enum": ["a", "b"], "type": "string"})
+        self.assertEqual(variants[1], {"anyOf": [{"type": "integer"}, {"type": "null"}]})
+        self.assertEqual(fixed_schema["required"], ["choice"])
+
 
 if __name__ == "__main__":
     unittest.main()
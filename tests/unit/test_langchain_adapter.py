@@ -0,0 +1,442 @@
+"""
+Unit tests for the LangChain adapter tool conversion.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.tools import ToolException
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+    TextResourceContents,
+    Tool,
+)
+from pydantic import ValidationError
+
+from mcp_use.adapters.langchain_adapter import (
+    BatchExecuteTool,
+    LangChainAdapter,
+    McpToLangChainAdapter,
+    ParsedToolResult,
+    PollJobTool,
+    ToolJobRegistry,
+    _parse_mcp_tool_result,
+)
+from mcp_use.connectors.base import BaseConnector
+from mcp_use.utils import get_shared_loop_thread
+
+
+def _tool(name: str, input_schema: dict) -> Tool:
+    return Tool(name=name, description=f"{name} tool", inputSchema=input_schema)
+
+
+class TestConvertTool:
+    """Tests for LangChainAdapter._convert_tool"""
+
+    def test_tools_share_module_level_class(self):
+        """Every converted tool is an instance of the single module-level adapter class."""
+        adapter = LangChainAdapter()
+        connector = MagicMock(spec=BaseConnector)
+
+        first = adapter._convert_tool(_tool("a", {"type": "object"}), connector)
+        second = adapter._convert_tool(
+            _tool("b", {"type": "object", "properties": {"x": {"type": "integer"}}}), connector
+        )
+
+        assert type(first) is McpToLangChainAdapter
+        assert type(second) is McpToLangChainAdapter
+        assert first.tool_connector is connector
+        assert second.description == "b tool"
+
+    def test_tools_are_immutable(self):
+        """Converted tools are frozen and expose variants through model_copy."""
+        adapter = LangChainAdapter()
+        tool = adapter._convert_tool(_tool("a", {"type": "object"}), MagicMock(spec=BaseConnector))
+
+        with pytest.raises(ValidationError):
+            tool.description = "changed"
+
+        assert tool.model_copy(update={"description": "changed"}).description == "changed"
+        assert tool.handle_tool_error is True
+
+    @pytest.mark.asyncio
+    async def test_handle_tool_error_is_configurable_per_tool(self):
+        """Disabling handle_tool_error on a tool lets its failures propagate."""
+        connector = MagicMock(spec=BaseConnector)
+        connector.call_tool = AsyncMock(side_effect=RuntimeError("boom"))
+        adapter = LangChainAdapter()
+        tool = adapter._convert_tool(_tool("a", {"type": "object"}), connector)
+        strict = McpToLangChainAdapter(
+            name="a", args_schema=tool.args_schema, tool_connector=connector, handle_tool_error=False
+        )
+
+        with pytest.raises(ValidationError):
+            tool.handle_tool_error = False
+        assert (await tool.ainvoke({}))["error"] == "RuntimeError"
+        for failing in (strict, tool.model_copy(update={"handle_tool_error": False})):
+            with pytest.raises(RuntimeError, match="boom"):
+                await failing.ainvoke({})
+
+    def test_identical_schemas_share_args_model(self):
+        """Tools with the same input schema reuse one compiled Pydantic model."""
+        adapter = LangChainAdapter()
+        connector = MagicMock(spec=BaseConnector)
+        schema = {"type": "object", "properties": {"path": {"type": "string"}}, "required": ["path"]}
+
+        first = adapter._convert_tool(_tool("read", dict(schema)), connector)
+        second = adapter._convert_tool(_tool("stat", {"required": ["path"], **schema}), connector)
+
+        assert first.args_schema is second.args_schema
+        assert first.name == "read"
+        assert second.name == "stat"
+
+    def test_unchanged_tools_are_reused_across_connectors(self):
+        """Reconverting an unchanged tool reuses it, rebinding only the connector."""
+        adapter = LangChainAdapter()
+        old_connector = MagicMock(spec=BaseConnector)
+        new_connector = MagicMock(spec=BaseConnector)
+        schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+
+        first = adapter._convert_tool(_tool("search", schema), old_connector)
+        again = adapter._convert_tool(_tool("search", schema), old_connector)
+        rebound = adapter._convert_tool(_tool("search", schema), new_connector)
+
+        assert again is first
+        assert rebound is not first
+        assert rebound.tool_connector is new_connector
+        assert rebound.args_schema is first.args_schema
+
+    def test_changed_tool_definition_is_rebuilt(self):
+        """A tool whose description or schema changed is converted again."""
+        adapter = LangChainAdapter()
+        connector = MagicMock(spec=BaseConnector)
+
+        first = adapter._convert_tool(_tool("search", {"type": "object"}), connector)
+        changed = adapter._convert_tool(
+            Tool(name="search", description="new description", inputSchema={"type": "object"}), connector
+        )
+
+        assert changed is not first
+        assert changed.description == "new description"
+
+    def test_input_schema_is_not_mutated(self):
+        """Schema fixing works on a copy of the tool's input schema."""
+        adapter = LangChainAdapter()
+        connector = MagicMock(spec=BaseConnector)
+        schema = {"type": "object", "properties": {"value": {"type": ["string", "null"]}}}
+
+        tool = adapter._convert_tool(_tool("nullable", schema), connector)
+
+        assert schema["properties"]["value"] == {"type": ["string", "null"]}
+        assert tool.args_schema(value=None).value is None
+
+
+class TestParseToolResult:
+    """Tests for flattening MCP tool results into strings"""
+
+    def test_text_only_result_is_a_string(self):
+        """Textual payloads are joined in content order into a plain string."""
+        result = CallToolResult(
+            content=[
+                TextContent(type="text", text="hello"),
+                EmbeddedResource(type="resource", resource=TextResourceContents(uri="file:///a", text=" doc")),
+            ]
+        )
+
+        assert _parse_mcp_tool_result(result) == "hello doc"
+
+    def test_binary_payloads_are_kept_apart(self):
+        """Image and blob payloads are not copied into the text until str() is called."""
+        result = CallToolResult(
+            content=[
+                TextContent(type="text", text="hello "),
+                ImageContent(type="image", data="aW1n", mimeType="image/png"),
+                EmbeddedResource(type="resource", resource=BlobResourceContents(uri="file:///b", blob="YmxvYg==")),
+            ]
+        )
+
+        parsed = _parse_mcp_tool_result(result)
+
+        assert isinstance(parsed, ParsedToolResult)
+        assert parsed.text == "hello "
+        assert parsed.binaries == [("image/png", "aW1n"), ("application/octet-stream", "YmxvYg==")]
+        assert str(parsed) == ("hello \ndata:image/png;base64,aW1n\ndata:application/octet-stream;base64,YmxvYg==")
+
+    def test_unknown_content_type_raises(self):
+        """Unsupported content items surface as a ToolException."""
+        result = CallToolResult.model_construct(content=[MagicMock(type="video")])
+
+        with pytest.raises(ToolException, match="video"):
+            _parse_mcp_tool_result(result)
+
+    @pytest.mark.asyncio
+    async def test_tool_returns_parsed_content(self):
+        """Calling the tool returns the flattened text rather than the content repr."""
+        connector = MagicMock(spec=BaseConnector)
+        connector.call_tool = AsyncMock(return_value=CallToolResult(content=[TextContent(type="text", text="42")]))
+        tool = LangChainAdapter()._convert_tool(_tool("answer", {"type": "object"}), connector)
+
+        assert await tool.ainvoke({}) == "42"
+        connector.call_tool.assert_awaited_once_with("answer", {})
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_reports_content_summary(self):
+        """An unparseable result is summarized instead of embedding the raw content repr."""
+        connector = MagicMock(spec=BaseConnector)
+        connector.call_tool = AsyncMock(
+            return_value=CallToolResult.model_construct(
+                content=[ImageContent(type="image", data="A" * 10_000, mimeType="image/png"), MagicMock(type="video")]
+            )
+        )
+        tool = LangChainAdapter()._convert_tool(_tool("snap", {"type": "object"}), connector)
+
+        output = await tool.ainvoke({})
+
+        assert output["error"] == "ToolException"
+        assert output["tool_content"] == "2 items, types=['image', 'video']"
+
+    def test_sync_invoke_runs_on_shared_loop(self):
+        """Synchronous invocation runs the async tool on the shared loop thread."""
+        threads = []
+
+        async def _call_tool(name, args):
+            threads.append(threading.current_thread().name)
+            return CallToolResult(content=[TextContent(type="text", text="sync")])
+
+        connector = MagicMock(spec=BaseConnector)
+        connector.call_tool = AsyncMock(side_effect=_call_tool)
+        connector.event_loop = get_shared_loop_thread().loop
+        tool = LangChainAdapter()._convert_tool(_tool("answer", {"type": "object"}), connector)
+
+        assert tool.invoke({}) == "sync"
+        assert tool.invoke({}) == "sync"
+        assert threads == ["mcp-use-loop", "mcp-use-loop"]
+
+    def test_sync_invoke_rejects_connector_of_another_loop(self):
+        """Synchronous invocation fails fast instead of waiting on a session of another loop."""
+        connector = MagicMock(spec=BaseConnector)
+        connector.call_tool = AsyncMock()
+        connector.event_loop = asyncio.new_event_loop()
+        tool = LangChainAdapter()._convert_tool(_tool("answer", {"type": "object"}), connector)
+
+        try:
+            with pytest.raises(RuntimeError, match="ainvoke"):
+                tool.invoke({})
+        finally:
+            connector.event_loop.close()
+        connector.call_tool.assert_not_called()
+
+
+class TestBatchExecuteTool:
+    """Tests for the batch_execute aggregator tool"""
+
+    def _connector(self, tools: list[Tool]) -> MagicMock:
+        connector = MagicMock(spec=BaseConnector)
+        connector.tools = tools
+        connector.list_tools = AsyncMock(return_value=tools)
+        connector.list_resources = AsyncMock(return_value=[])
+        connector.list_prompts = AsyncMock(return_value=[])
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_added_only_when_enabled(self):
+        """The batch tool is appended after the MCP tools only when batching is enabled."""
+        tools = [_tool("a", {"type": "object"})]
+
+        plain = await LangChainAdapter()._create_tools_from_connectors([self._connector(tools)])
+        batched = await LangChainAdapter(batch_tool_calls=True)._create_tools_from_connectors([self._connector(tools)])
+
+        assert [tool.name for tool in plain] == ["a"]
+        assert [tool.name for tool in batched] == ["a", "batch_execute"]
+        assert isinstance(batched[-1], BatchExecuteTool)
+
+    @pytest.mark.asyncio
+    async def test_runs_calls_concurrently_and_reports_errors(self):
+        """Calls run in parallel up to the limit and failures are reported per call, in order."""
+        running = 0
+        peak = 0
+
+        async def _call_tool(name, args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if name == "broken":
+                raise RuntimeError("boom")
+            return CallToolResult(content=[TextContent(type="text", text=f"{name}:{args['n']}")])
+
+        schema = {"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]}
+        connector = self._connector([_tool("echo", schema), _tool("broken", schema)])
+        connector.call_tool = AsyncMock(side_effect=_call_tool)
+        adapter = LangChainAdapter(batch_tool_calls=True, max_concurrent_calls=2)
+        batch = (await adapter._create_tools_from_connectors([connector]))[-1]
+
+        output = await batch.ainvoke(
+            {
+                "calls": [
+                    {"tool": "echo", "args": {"n": 1}},
+                    {"tool": "broken", "args": {"n": 2}},
+                    {"tool": "echo", "args": {"n": 3}},
+                    {"tool": "missing"},
+                    {"tool": "echo", "args": {"n": "many"}},
+                ]
+            }
+        )
+
+        assert [entry.get("result") for entry in output] == ["echo:1", None, "echo:3", None, None]
+        assert [entry["error"]["error"] for entry in output if "error" in entry] == [
+            "RuntimeError",
+            "ToolException",
+            "ValidationError",
+        ]
+        assert output[3]["error"]["details"] == "Unknown tool: missing"
+        assert connector.call_tool.await_count == 3
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_long_running_tools_start_jobs_from_a_batch(self):
+        """Batched calls to long-running tools return a job like a direct call does."""
+        connector = self._connector([_tool("render", {"type": "object"})])
+        connector.call_tool = AsyncMock(return_value=CallToolResult(content=[TextContent(type="text", text="done")]))
+        adapter = LangChainAdapter(batch_tool_calls=True, long_running_tools=["render"])
+        tools = {tool.name: tool for tool in await adapter._create_tools_from_connectors([connector])}
+
+        output = await tools["batch_execute"].ainvoke({"calls": [{"tool": "render"}]})
+
+        job = output[0]["result"]
+        assert job["status"] == "started"
+        await adapter._jobs.get(job["job_id"])
+        assert await tools["poll_job"].ainvoke({"job_id": job["job_id"]}) == "done"
+
+    def test_sync_invoke_runs_batch_on_shared_loop(self):
+        """A synchronous batch runs on the shared loop when its tools' sessions live there."""
+        connector = self._connector([_tool("echo", {"type": "object"})])
+        connector.call_tool = AsyncMock(return_value=CallToolResult(content=[TextContent(type="text", text="hi")]))
+        connector.event_loop = get_shared_loop_thread().loop
+        adapter = LangChainAdapter(batch_tool_calls=True)
+        batch = get_shared_loop_thread().run(adapter._create_tools_from_connectors([connector]))[-1]
+
+        assert batch.invoke({"calls": [{"tool": "echo"}]}) == [{"tool": "echo", "result": "hi"}]
+
+    def test_sync_invoke_rejects_batch_on_another_loop(self):
+        """A synchronous batch fails fast when a called tool's session lives on another loop."""
+        connector = self._connector([_tool("echo", {"type": "object"})])
+        connector.call_tool = AsyncMock()
+        connector.event_loop = asyncio.new_event_loop()
+        adapter = LangChainAdapter(batch_tool_calls=True)
+        batch = get_shared_loop_thread().run(adapter._create_tools_from_connectors([connector]))[-1]
+
+        try:
+            with pytest.raises(RuntimeError, match="ainvoke"):
+                batch.invoke({"calls": [{"tool": "echo"}]})
+        finally:
+            connector.event_loop.close()
+        connector.call_tool.assert_not_called()
+
+
+class TestLongRunningTools:
+    """Tests for background execution of long-running tools"""
+
+    @pytest.mark.asyncio
+    async def test_long_running_tool_returns_job_and_poll_job_fetches_result(self):
+        """A long-running tool returns a job id right away and poll_job reports its progress."""
+        release = asyncio.Event()
+
+        async def _call_tool(name, args):
+            await release.wait()
+            return CallToolResult(content=[TextContent(type="text", text="rendered")])
+
+        connector = MagicMock(spec=BaseConnector)
+        connector.tools = [_tool("render", {"type": "object"}), _tool("quick", {"type": "object"})]
+        connector.list_tools = AsyncMock(return_value=connector.tools)
+        connector.list_resources = AsyncMock(return_value=[])
+        connector.list_prompts = AsyncMock(return_value=[])
+        connector.call_tool = AsyncMock(side_effect=_call_tool)
+        adapter = LangChainAdapter(long_running_tools=["render"])
+
+        tools = {tool.name: tool for tool in await adapter._create_tools_from_connectors([connector])}
+
+        assert set(tools) == {"render", "quick", "poll_job"}
+        assert tools["quick"].jobs is None
+        started = await tools["render"].ainvoke({})
+        assert started["status"] == "started"
+        assert await tools["poll_job"].ainvoke({"job_id": started["job_id"]}) == {
+            "job_id": started["job_id"],
+            "status": "running",
+        }
+
+        release.set()
+        await adapter._jobs.get(started["job_id"])
+
+        assert await tools["poll_job"].ainvoke({"job_id": started["job_id"]}) == "rendered"
+        assert (await tools["poll_job"].ainvoke({"job_id": started["job_id"]}))["error"] == "ToolException"
+
+    def test_sync_host_can_collect_jobs(self):
+        """Jobs started by a synchronous call are collected with a synchronous poll_job call."""
+        connector = MagicMock(spec=BaseConnector)
+        connector.tools = [_tool("render", {"type": "object"})]
+        connector.list_tools = AsyncMock(return_value=connector.tools)
+        connector.list_resources = AsyncMock(return_value=[])
+        connector.list_prompts = AsyncMock(return_value=[])
+        connector.call_tool = AsyncMock(
+            return_value=CallToolResult(content=[TextContent(type="text", text="rendered")])
+        )
+        connector.event_loop = get_shared_loop_thread().loop
+        adapter = LangChainAdapter(long_running_tools=["render"])
+        tools = {
+            tool.name: tool for tool in get_shared_loop_thread().run(adapter._create_tools_from_connectors([connector]))
+        }
+
+        started = tools["render"].invoke({})
+        get_shared_loop_thread().run(asyncio.wait([adapter._jobs.get(started["job_id"])]))
+
+        assert tools["poll_job"].invoke({"job_id": started["job_id"]}) == "rendered"
+
+    @pytest.mark.asyncio
+    async def test_sync_poll_rejects_jobs_of_another_loop(self):
+        """Polling synchronously fails fast for a job running on another event loop."""
+        jobs = ToolJobRegistry()
+        job_id = jobs.start(asyncio.sleep(10))
+
+        with pytest.raises(RuntimeError, match="ainvoke"):
+            PollJobTool(jobs=jobs).invoke({"job_id": job_id})
+
+        await jobs.cancel_all()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_reported_as_cancelled(self):
+        """Polling a cancelled job reports its status instead of raising CancelledError."""
+        jobs = ToolJobRegistry()
+        job_id = jobs.start(asyncio.sleep(10))
+        jobs.get(job_id).cancel()
+        await asyncio.sleep(0)
+
+        assert await PollJobTool(jobs=jobs).ainvoke({"job_id": job_id}) == {"job_id": job_id, "status": "cancelled"}
+        assert jobs.get(job_id) is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_stops_and_forgets_jobs(self):
+        """cancel_all cancels running jobs and drops finished ones that were never polled."""
+
+        async def _fail():
+            raise RuntimeError("boom")
+
+        jobs = ToolJobRegistry()
+        failed_id = jobs.start(_fail())
+        running_id = jobs.start(asyncio.sleep(10))
+        running = jobs.get(running_id)
+        await asyncio.sleep(0)
+
+        await jobs.cancel_all()
+
+        assert running.cancelled()
+        assert jobs.get(failed_id) is None
+        assert jobs.get(running_id) is None
@@ -0,0 +1,45 @@
+"""
+Unit tests for the middleware session wrapper.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import CallToolRequestParams, CallToolResult, TextContent
+
+from mcp_use.middleware import Middleware, MiddlewareManager
+from mcp_use.middleware.middleware import CallbackClientSession
+
+
+class _RecordingMiddleware(Middleware):
+    def __init__(self):
+        self.contexts = []
+
+    async def on_call_tool(self, context, call_next):
+        self.contexts.append(context)
+        return await call_next(context)
+
+
+class TestCallbackClientSession:
+    """Tests for CallbackClientSession"""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_passes_params_to_middleware(self):
+        """Middleware sees the tool name and arguments of the call, which is forwarded unchanged."""
+        result = CallToolResult(content=[TextContent(type="text", text="8")])
+        client_session = MagicMock()
+        client_session.call_tool = AsyncMock(return_value=result)
+        middleware = _RecordingMiddleware()
+        manager = MiddlewareManager()
+        manager.add_middleware(middleware)
+        session = CallbackClientSession(client_session, "test-connector", manager)
+
+        assert await session.call_tool("add", {"a": 5, "b": 3}) is result
+
+        [context] = middleware.contexts
+        assert context.method == "tools/call"
+        assert context.connection_id == "test-connector"
+        assert isinstance(context.params, CallToolRequestParams)
+        assert context.params.name == "add"
+        assert context.params.arguments == {"a": 5, "b": 3}
+        client_session.call_tool.assert_awaited_once_with("add", {"a": 5, "b": 3})